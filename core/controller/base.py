@@ -14,6 +14,8 @@ class BaseController(Generic[ModelType]):
     def __init__(self, model_class: Type[ModelType], repository: BaseRepository) -> None:
         self.model_class = model_class
         self.repository = repository
+        # Assembled once so 404s don't pay for `.title()` and f-string pieces per raise.
+        self._not_found_template = "%s with id: %%s does not exist" % model_class.__tablename__.title()
 
     async def count(
         self,
@@ -34,12 +36,16 @@ class BaseController(Generic[ModelType]):
         fields: Optional[list] = None,
         distinct_: Optional[list] = None,
         join_: Optional[set[str]] = None,
+        load_: Optional[dict[str, str]] = None,
         order_: Optional[dict] = None,
         where_: Optional[list] = None,
         group_by_: Optional[list] = None,
     ):
         """
         Returns a list of records based on pagination params.
+
+        `load_` maps relationship names to an eager-loading strategy
+        (`'selectin'` or `'joined'`) so callers can avoid N+1 lazy loads.
         """
         response = await self.repository.get_many(
             skip=skip,
@@ -47,12 +53,45 @@ class BaseController(Generic[ModelType]):
             fields=fields,
             distinct_=distinct_,
             join_=join_,
+            load_=load_,
             order_=order_,
             where_=where_,
             group_by_=group_by_,
         )
         return response
 
+    async def get_many_and_count(
+        self,
+        skip: Optional[int] = None,
+        limit: Optional[int] = None,
+        distinct_: Optional[list] = None,
+        join_: Optional[set[str]] = None,
+        load_: Optional[dict[str, str]] = None,
+        order_: Optional[dict] = None,
+        where_: Optional[list] = None,
+    ):
+        """
+        Returns a page of records plus the total match count in one query.
+        """
+        return await self.repository.get_many_and_count(
+            skip=skip,
+            limit=limit,
+            distinct_=distinct_,
+            join_=join_,
+            load_=load_,
+            order_=order_,
+            where_=where_,
+        )
+
+    async def get_by_id(self, id_: Any, load_: Optional[dict[str, str]] = None) -> ModelType:
+        """
+        Returns the record with the given id, or raises NotFoundException.
+        """
+        obj = await self.repository.get_by_pk(id_, load_=load_)
+        if obj is None:
+            raise NotFoundException(self._not_found_template % (id_,))
+        return obj
+
     @Transactional()
     async def create(self, attributes: dict[str, Any]) -> ModelType:
         """
@@ -82,10 +121,16 @@ class BaseController(Generic[ModelType]):
         self,
         where_: Optional[list] = None,
         *,
+        returning_: bool = False,
         synchronize_session: SynchronizeSessionEnum = SynchronizeSessionEnum.FALSE,
-    ) -> None:
+    ):
         """
         Deletes the Object from the DB.
+
+        Returns the deleted instances when `returning_` is set, otherwise the
+        number of deleted rows.
         """
-        delete = await self.repository.delete(where_=where_, synchronize_session=synchronize_session)
+        delete = await self.repository.delete(
+            where_=where_, returning_=returning_, synchronize_session=synchronize_session
+        )
         return delete
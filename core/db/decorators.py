@@ -1,6 +1,5 @@
 from functools import wraps
 from typing import Awaitable, Callable, TypeVar
-from uuid import uuid4
 
 from typing_extensions import ParamSpec
 
@@ -21,14 +20,20 @@ class Transactional:
             # Unit testing does not involve database connections.
             if settings.PYTEST_UNIT:
                 return await fn(*args, **kwargs)
-            db_session_keeper = DB_MANAGER[dialect]
+            session = DB_MANAGER[dialect].session
 
             try:
                 result = await fn(*args, **kwargs)
-                await db_session_keeper.session.commit()
-            except Exception as e:
-                await db_session_keeper.session.rollback()
-                raise e
+            except BaseException:
+                await session.rollback()
+                raise
+
+            # Repositories emit Core DML that bypasses the unit of work, so the
+            # only safe skip is when no transaction was opened at all.
+            # (`session()` resolves the scoped registry to the real AsyncSession;
+            # the proxy itself does not expose `in_transaction`.)
+            if session().in_transaction():
+                await session.commit()
 
             return result
 
@@ -40,15 +45,12 @@ def session_scope(dialect: Dialect):
         @wraps(fn)
         async def wrapper(*args, **kwargs):
             db_session_keeper = DB_MANAGER[dialect]
-            session_id = str(uuid4())
-            context = db_session_keeper.set_session_context(session_id=session_id)
             try:
                 return await fn(*args, **kwargs)
-            except Exception as e:
-                raise e
             finally:
+                # Sessions are scoped to the running asyncio task; dropping the
+                # registry entry here is all the cleanup that is needed.
                 await db_session_keeper.session.remove()
-                db_session_keeper.reset_session_context(context=context)
 
         return wrapper
 
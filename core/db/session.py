@@ -1,9 +1,11 @@
+import asyncio
 from collections import deque
-from contextvars import ContextVar, Token
 from enum import Enum
 from typing import Any, Optional
-from uuid import uuid4
 
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import Insert as PGInsert
 from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Session
 from sqlalchemy.pool import NullPool
@@ -17,31 +19,56 @@ class EngineType(Enum):
     READER = "reader"
 
 
+# Exact DML classes seen on the hot path; `type(clause) in ...` is a single
+# hash lookup instead of three isinstance walks. PGInsert is included because
+# the repository builds inserts through the postgresql dialect.
+_WRITE_CLAUSES = frozenset({Update, Delete, Insert, PGInsert})
+
+
 class RoutingSession(Session):
     def __init__(self, engines, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.engines = engines
+        # get_bind runs for every SQL emission; resolve the sync engines once
+        # instead of a dict lookup plus property call per statement.
+        self._writer_bind = engines[EngineType.WRITER].sync_engine
+        self._reader_bind = engines[EngineType.READER].sync_engine
 
     def get_bind(self, mapper=None, clause=None, **kw):
-        if self._flushing or isinstance(clause, (Update, Delete, Insert)):
-            return self.engines[EngineType.WRITER].sync_engine
+        if self._flushing or type(clause) in _WRITE_CLAUSES or getattr(clause, "is_dml", False):
+            return self._writer_bind
         else:
-            return self.engines[EngineType.READER].sync_engine
+            return self._reader_bind
 
 
 class DBSessionKeeper:
-    def __init__(self, database_uri: str, testing=settings.PYTEST):
-        self.session_context: ContextVar[str] = ContextVar(str(uuid4()))
+    def __init__(self, database_uri: str, reader_uri: Optional[str] = None, testing=settings.PYTEST):
+        # Reads may target a replica; writes always go to the primary.
+        reader_uri = reader_uri or database_uri
 
         if not testing:
+            engine_kwargs = {
+                "pool_size": settings.SQLALCHEMY_POOL_SIZE,
+                "max_overflow": settings.SQLALCHEMY_MAX_OVERFLOW,
+                "pool_timeout": settings.SQLALCHEMY_POOL_TIMEOUT,
+                "pool_recycle": 3600,
+                "insertmanyvalues_page_size": 1000,
+                # The repository layer generates many distinct statement shapes
+                # (filters, orderings, loader options); a larger compiled-SQL
+                # cache keeps them all warm instead of evicting under the 500
+                # default.
+                "query_cache_size": 1200,
+            }
             self.engines = {
-                EngineType.WRITER: create_async_engine(database_uri, pool_recycle=3600),
-                EngineType.READER: create_async_engine(database_uri, pool_recycle=3600),
+                EngineType.WRITER: create_async_engine(database_uri, **engine_kwargs),
+                # Replicas may sit behind a failover proxy, so only the reader
+                # pays the pre-ping round trip to weed out stale connections.
+                EngineType.READER: create_async_engine(reader_uri, pool_pre_ping=True, **engine_kwargs),
             }
         else:
             self.engines = {
                 EngineType.WRITER: create_async_engine(database_uri, poolclass=NullPool),
-                EngineType.READER: create_async_engine(database_uri, poolclass=NullPool),
+                EngineType.READER: create_async_engine(reader_uri, poolclass=NullPool),
             }
 
         self.async_session_factory = async_sessionmaker(
@@ -50,23 +77,37 @@ class DBSessionKeeper:
             expire_on_commit=False,
             engines=self.engines,
         )
+        # Scoping by the running asyncio task gives each request (and each
+        # background job) its own session without any per-request ContextVar
+        # bookkeeping or middleware.
         self._session = async_scoped_session(
             session_factory=self.async_session_factory,
-            scopefunc=self.get_session_context,
+            scopefunc=asyncio.current_task,
         )
 
     @property
     def session(self) -> async_scoped_session[AsyncSession]:
         return self._session
 
-    def get_session_context(self) -> str:
-        return self.session_context.get()
+    async def prewarm(self) -> None:
+        """
+        Opens the full pool on each engine before traffic arrives.
+
+        Every held connection waits on a barrier so the pool really grows to
+        `pool_size` instead of the first few connections being checked back
+        in and reused; without this the first burst of real requests pays
+        connection setup (TCP + auth) inline.
+        """
+        count = settings.SQLALCHEMY_POOL_SIZE
+        for engine in dict.fromkeys(self.engines.values()):
+            barrier = asyncio.Barrier(count)
 
-    def set_session_context(self, session_id: str) -> Token:
-        return self.session_context.set(session_id)
+            async def hold(engine=engine, barrier=barrier):
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+                    await barrier.wait()
 
-    def reset_session_context(self, context):
-        self.session_context.reset(context)
+            await asyncio.gather(*(hold() for _ in range(count)))
 
     async def get_session(self):
         """
@@ -75,7 +116,7 @@ class DBSessionKeeper:
         try:
             yield self.session
         finally:
-            await self.session.close()
+            await self.session.remove()
 
 
 """
@@ -88,9 +129,15 @@ class Dialect(str, Enum):
     AUTH_POSTGERS = "This DB Session served for OAuth2"
 
 
+# Both dialects currently point at the same database, so they share one
+# keeper (and therefore one set of connection pools) instead of doubling
+# every pool. Give AUTH_POSTGERS its own keeper again if it ever moves to
+# a dedicated instance.
+_postgres_keeper = DBSessionKeeper(settings.SQLALCHEMY_POSTGRES_URI, reader_uri=settings.SQLALCHEMY_POSTGRES_READER_URI)
+
 DB_MANAGER = {
-    Dialect.POSTGRES: DBSessionKeeper(settings.SQLALCHEMY_POSTGRES_URI),
-    Dialect.AUTH_POSTGERS: DBSessionKeeper(settings.SQLALCHEMY_POSTGRES_URI),
+    Dialect.POSTGRES: _postgres_keeper,
+    Dialect.AUTH_POSTGERS: _postgres_keeper,
 }
 
 
@@ -133,8 +180,11 @@ class Base(DeclarativeBase):
     def _to_dict_dfs(self, exclude: Optional[list[str]] = None, seen: set = None) -> dict[str, Any]:
         """
         Convert the SQLAlchemy model instance to a dictionary.
+
+        Attributes are enumerated through the mapper instead of ``__dict__``, and
+        relationships that are not loaded yet are skipped entirely so serialization
+        never emits lazy-load SELECTs (the classic N+1 trap).
         """
-        # Get the dictionary representation of the SQLAlchemy model instance
         if seen is None:
             seen = set()
 
@@ -144,14 +194,20 @@ class Base(DeclarativeBase):
 
         seen.add(id(self))
 
-        # Get the dictionary representation of the SQLAlchemy model instance
-        obj_dict = self.__dict__
+        state = sa_inspect(self)
+        unloaded = state.unloaded
 
-        # Filter out internal attributes and create a new dictionary
         filtered_obj_dict = {}
-        for key, value in obj_dict.items():
-            if key.startswith("_") or (exclude and key in exclude):
+        for attr in state.mapper.column_attrs:
+            key = attr.key
+            if key in unloaded or (exclude and key in exclude):
+                continue
+            filtered_obj_dict[key] = getattr(self, key)
+
+        for key in state.mapper.relationships.keys():
+            if key in unloaded or (exclude and key in exclude):
                 continue
+            value = getattr(self, key)
             if isinstance(value, Base):
                 # Recursively convert the related object to a dictionary
                 v = value._to_dict_dfs(seen=seen)
@@ -166,7 +222,6 @@ class Base(DeclarativeBase):
                             v.append(x)
                     else:
                         v.append(item)
-                # filtered_obj_dict[key] = [item._to_dict_dfs(seen=seen) if isinstance(item, Base) else item for item in value]
                 filtered_obj_dict[key] = v
             else:
                 filtered_obj_dict[key] = value
@@ -187,12 +242,19 @@ class Base(DeclarativeBase):
 
             seen.add(obj_id)
 
-            # Get the dictionary representation of the SQLAlchemy model instance
-            obj_dict = current_obj.__dict__
+            state = sa_inspect(current_obj)
+            unloaded = state.unloaded
+
+            for attr in state.mapper.column_attrs:
+                key = attr.key
+                if key in unloaded or (exclude and key in exclude):
+                    continue
+                current_dict[key] = getattr(current_obj, key)
 
-            for key, value in obj_dict.items():
-                if key.startswith("_") or (exclude and key in exclude):
+            for key in state.mapper.relationships.keys():
+                if key in unloaded or (exclude and key in exclude):
                     continue
+                value = getattr(current_obj, key)
 
                 if isinstance(value, Base):
                     if id(value) in seen:
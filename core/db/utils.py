@@ -1,7 +1,6 @@
 import asyncio
 from contextlib import asynccontextmanager
 from typing import TypeVar
-from uuid import uuid4
 
 from .session import Base, DBSessionKeeper
 
@@ -13,12 +12,13 @@ async def session_context(db_session: DBSessionKeeper):
     """An asynchronous context manager that provides a transactional scope
     for database operations.
 
+    The session is scoped to the current asyncio task; `get_session` removes
+    it from the registry once the block exits.
+
     Args:
         db_session (DBSession): The database session object that manages
         session lifecycle and transaction handling.
     """
-    context = db_session.set_session_context(str(uuid4()))
-
     session_generator = db_session.get_session()
     session = None
     try:
@@ -33,6 +33,6 @@ async def session_context(db_session: DBSessionKeeper):
             await session.rollback()
         raise
     finally:
-        if session is not None:
-            await session.remove()
-        db_session.reset_session_context(context)
+        # Run the generator's cleanup (scoped-session remove) now rather than
+        # at GC, so the task-keyed registry entry never outlives the block.
+        await session_generator.aclose()
@@ -4,10 +4,20 @@ import core.utils as ut
 
 
 class CustomException(Exception):
-    code = HTTPStatus.BAD_GATEWAY
-    error_code = HTTPStatus.BAD_GATEWAY
+    code = int(HTTPStatus.BAD_GATEWAY)
+    error_code = int(HTTPStatus.BAD_GATEWAY)
     message = HTTPStatus.BAD_GATEWAY.description
 
+    _repr_prefix = "CustomException("
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._repr_prefix = cls.__name__ + "("
+        # Class bodies stay readable with HTTPStatus members, but handlers and
+        # response serialization see plain ints — no IntEnum coercion per raise.
+        cls.code = int(cls.code)
+        cls.error_code = int(cls.error_code)
+
     def __init__(self, message=None):
         self.message = message or self.message
         super().__init__(self.message)
@@ -17,7 +27,7 @@ class CustomException(Exception):
             sentry_sdk.capture_exception(self)
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({self.message})"
+        return self._repr_prefix + str(self.message) + ")"
 
 
 class ApplicationException(CustomException):
@@ -1,5 +0,0 @@
-from .sqlalchemy import SQLAlchemyMiddleware
-
-__all__ = [
-    "SQLAlchemyMiddleware",
-]
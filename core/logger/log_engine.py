@@ -1,5 +1,6 @@
-import inspect
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Any
 
@@ -8,6 +9,52 @@ from loguru import logger
 import core.utils as ut
 from core.settings import settings
 
+if ut.has("sqlalchemy"):
+    from sqlalchemy import Engine, event
+
+# Ranks cover both the LOG_LEVEL vocabulary (WARN/FATAL) and the loguru
+# level names the helper methods pass (WARNING/CRITICAL); a name missing
+# here would silently rank as INFO and be mis-filtered.
+_LEVEL_MAP = {
+    "DEBUG": 0,
+    "INFO": 1,
+    "WARN": 2,
+    "WARNING": 2,
+    "ERROR": 3,
+    "FATAL": 4,
+    "CRITICAL": 4,
+}
+
+# Loguru resolves {name}/{function}/{line} itself from the depth-adjusted
+# caller frame, so no Python-level caller introspection runs per call.
+_DEFAULT_LOG_FORMAT = (
+    "<green>[{time:YYYY-MM-DD HH:mm:ss.SSS}]</green> "
+    "<level>{level: <6}</level> "
+    "<cyan>{name}.{function}::{line}</cyan>  "
+    ">>> <level>{message}</level>"
+)
+
+
+def _get_level(level: str) -> int:
+    return _LEVEL_MAP.get(str(level.upper()), 1)
+
+
+class _LazyJoin:
+    """Defers stringifying log items until loguru actually formats the record."""
+
+    __slots__ = ("items",)
+
+    def __init__(self, items):
+        self.items = items
+
+    def __str__(self):
+        items = self.items
+        # Single-argument calls are the overwhelmingly common shape; skip the
+        # join machinery for them.
+        if len(items) == 1:
+            return str(items[0])
+        return " ".join(map(str, items))
+
 
 @ut.singleton
 class LogEngine:
@@ -15,96 +62,43 @@ class LogEngine:
         self._logger = logger
         self.setup()
         self.log_level = settings.LOG_LEVEL
+        # Settings never change after startup; snapshotting them here keeps
+        # the per-call gate to plain instance-attribute reads.
+        self._debug_enabled = bool(settings.DEBUG)
+        self._min_level_int = _get_level(self.log_level)
         if ut.has("sqlalchemy"):
             self._configure_sqlalchemy()
 
     def setup(self):
-        log_format = (
-            "<green>[{time:YYYY-MM-DD HH:mm:ss.SSS}]</green> "
-            "<level>{level: <6}</level> "
-            "<cyan>{name}.py</cyan> "
-            "<cyan>{line}</cyan> => "
-            "<level>{message}</level>"
+        # A single sink configured once. The previous remove()/add() on every
+        # log call rebuilt loguru's handler table and re-parsed the format
+        # string each time, which dominated the cost of a log line.
+        self._logger.remove()
+        # enqueue=True routes records through loguru's background worker thread,
+        # so formatting and the stdout write happen off the caller. That matters
+        # most for the SQLAlchemy cursor events, which log on every statement
+        # from inside the DB hot path.
+        self._logger.add(
+            sys.stdout,
+            colorize=True,
+            format=_DEFAULT_LOG_FORMAT,
+            level="DEBUG",
+            backtrace=True,
+            diagnose=True,
+            enqueue=True,
         )
-        self._logger.add(sys.stdout, format=log_format, level="INFO")
-
-    def get_caller_info(self, skip=3) -> dict[str, str]:
-        """
-        Return information about the caller.
-
-        Reference: https://gist.github.com/techtonik/2151727
-
-        Args:
-            skip (int): Number of frames to skip when retrieving caller information. Default is 3.
-
-            - skip=1 means "who calls me"
-            - skip=2 "who calls my caller".
-        """
-
-        caller_info = {
-            "package": "",
-            "module": "",
-            "classname": "",
-            "caller": "",
-            "line": "",
-        }
-        stack = inspect.stack()
-        start = 0 + skip
-        if len(stack) < start + 1:
-            return caller_info
-        frame = stack[start][0]
-
-        # Get information about the caller
-        module_info = inspect.getmodule(frame)
-        if module_info:
-            mod = module_info.__name__.split(".")
-            caller_info["package"] = mod[0]
-            caller_info["module"] = ".".join(mod[1:])
-
-        # class name
-        if "self" in frame.f_locals:
-            caller_info["classname"] = frame.f_locals["self"].__class__.__name__
-
-        # caller
-        if frame.f_code.co_name != "<module>":  # top level usually
-            caller_info["caller"] = frame.f_code.co_name
-
-        # Line number
-        caller_info["line"] = str(frame.f_lineno)
-
-        return caller_info
-
-    def _get_level(self, level: str) -> int:
-        level_map = {
-            "DEBUG": 0,
-            "INFO": 1,
-            "WARN": 2,
-            "ERROR": 3,
-            "FATAL": 4,
-        }
-        return level_map.get(str(level.upper()), 1)
 
     def log(self, level="DEBUG", *items: Any) -> None:
-        if not settings.DEBUG or self._get_level(level) < self._get_level(self.log_level):
+        # Gate on precomputed values before any caller-info or formatting work
+        # happens; filtered calls cost two attribute reads and a compare. The
+        # helper methods pass uppercase loguru level names, all ranked in
+        # _LEVEL_MAP, so no .upper() is needed here.
+        if not self._debug_enabled or _LEVEL_MAP.get(level, 1) < self._min_level_int:
             return
-        self._logger.remove()
-        caller_info = self.get_caller_info()
-        context = {
-            "original_name": f"{caller_info['package']}.{caller_info['module']}",
-            "original_line": caller_info["line"],
-            "original_class": caller_info["classname"],
-            "original_caller": caller_info["caller"],
-        }
-        log_format = (
-            "<green>[{time:YYYY-MM-DD HH:mm:ss.SSS}]</green> "
-            "<level>{level: <6}</level> "
-            "<cyan>{extra[original_name]}.{extra[original_class]}.{extra[original_caller]}::"
-            "{extra[original_line]}</cyan>  "
-            ">>> <level>{message}</level>"
-        )
-        self._logger.add(sys.stdout, colorize=True, format=log_format, backtrace=True, diagnose=True)
-        message = " ".join([str(i) for i in items])
-        self._logger.bind(**context).log(level, message)
+        # depth=2 skips this method and the public helper (info/error/...), so
+        # loguru attributes the record to the real call site without any
+        # caller introspection of our own.
+        self._logger.opt(depth=2).log(level, "{}", _LazyJoin(items))
 
     def __call__(self, *items: Any) -> None:
         self.log("DEBUG", *items)
@@ -125,26 +119,34 @@ class LogEngine:
         self.log("CRITICAL", *items)
 
     def exception(self, *items: Any) -> None:
-        self.log("EXCEPTION", *items)
+        # "EXCEPTION" is not a registered loguru level; log at ERROR with the
+        # active exception attached, mirroring loguru's own .exception().
+        if not self._debug_enabled or _LEVEL_MAP["ERROR"] < self._min_level_int:
+            return
+        self._logger.opt(depth=1, exception=True).log("ERROR", "{}", _LazyJoin(items))
 
     def _configure_sqlalchemy(self):
-        from sqlalchemy import Engine, event
-
-        # Configure SQLAlchemy to use custom logger
-        sqlalchemy_logger = logging.getLogger("sqlalchemy.engine")
-        sqlalchemy_logger.setLevel(logging.INFO)
-
-        class SQLAlchemyLogHandler(logging.Handler):
-            def __init__(self, engine_instance):
-                super().__init__()
-                self.engine_instance = engine_instance
-
-            def emit(self, record):
-                log_entry = self.format(record)
-                self.engine_instance.debug(log_entry)
+        # Skip the whole pipeline when statement logs would be filtered
+        # anyway: with no listeners attached, SQLAlchemy's event dispatch for
+        # cursor execution stays a no-op, so production pays nothing per query.
+        if not self._debug_enabled or _LEVEL_MAP["INFO"] < self._min_level_int:
+            return
 
-        handler = SQLAlchemyLogHandler(self)
-        sqlalchemy_logger.addHandler(handler)
+        # Statement logging fires on every query, so it bypasses loguru's
+        # record/bind/format pipeline entirely: a stdlib logger defers
+        # %-formatting until a handler consumes the record, and the
+        # QueueHandler hands the record to a daemon-thread QueueListener so
+        # the DB hot path only pays a queue put.
+        sql_logger = logging.getLogger("sqlalchemy.sql")
+        sql_logger.setLevel(logging.INFO)
+        sql_logger.propagate = False
+
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("[%(asctime)s] %(levelname)-6s %(name)s => %(message)s"))
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        sql_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._sql_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        self._sql_listener.start()
 
         @event.listens_for(Engine, "before_cursor_execute")
         def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
@@ -153,7 +155,7 @@ class LogEngine:
 
             Reference: https://docs.sqlalchemy.org/en/20/core/events.html#sqlalchemy.events.ConnectionEvents.before_cursor_execute
             """
-            self.info("Executing SQL:\n", "```sql\n", f"{statement}", "\n```\nParameters:\n", f"{parameters}")
+            sql_logger.info("Executing SQL:\n```sql\n%s\n```\nParameters:\n%s", statement, parameters)
 
         @event.listens_for(Engine, "after_cursor_execute")
         def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
@@ -1,16 +1,17 @@
-import traceback
-from functools import reduce, wraps
-from typing import Any, Awaitable, Callable, Dict, Generic, Optional, ParamSpec, Sequence, Type, TypeVar
+from functools import lru_cache, wraps
+from itertools import islice
+from typing import Any, Awaitable, Callable, Dict, Generic, Iterable, Optional, ParamSpec, Sequence, Type, TypeVar
 
-from sqlalchemy import Select, delete, func, inspect, select, update
+from sqlalchemy import Select, delete, func, inspect, literal, select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from core.db import Base
 from core.exceptions import SystemException
 from core.logger import syslog
+from core.settings import settings
 
 from .enum import SynchronizeSessionEnum
 
@@ -20,31 +21,89 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 
-def safeguard_db_ops():
-    """A decorator to safeguard database operations and handle exceptions."""
+@lru_cache(maxsize=None)
+def _base_select(model_class) -> Select:
+    """Plain `SELECT <entity>` skeleton, shared across calls for a given model.
 
-    def decorator(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
-        @wraps(fn)
-        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            try:
-                return await fn(*args, **kwargs)
-            except SQLAlchemyError as e:
-                msg = f"An error occurred while executing the database operation: {e}"
-                syslog.error(msg)
-                traceback.print_exc()
-                raise SystemException(msg)
+    Clause application (`where`, `limit`, ...) is generative and never mutates
+    the cached statement. Caching fully-built statements keyed by argument
+    signature is deliberately avoided: `where_`/`order_` carry live bound
+    expressions, and SQLAlchemy's own compiled-statement cache already reuses
+    the compilation work for structurally identical statements.
+    """
+    return select(model_class)
 
-        return wrapper
 
-    return decorator
+@lru_cache(maxsize=None)
+def _default_select(model_class) -> Select:
+    """Fully-defaulted `SELECT <entity>` for argument-less queries.
+
+    This is what `_query` produces when every optional argument is left unset
+    (the common `first()` / unfiltered `get_many` shape), including the
+    strict-loading guard, so those calls can skip clause application entirely.
+    """
+    query = _base_select(model_class)
+    if settings.STRICT_LOADING:
+        query = query.options(raiseload("*", sql_only=True))
+    return query
+
+
+@lru_cache(maxsize=None)
+def _column_map(model_class) -> dict[str, Any]:
+    """Maps column names to their instrumented attributes, built once per model.
+
+    Looking a column up here replaces the descriptor-protocol walk that
+    `getattr` on the model class performs for every ordering term.
+    """
+    return {column.key: getattr(model_class, column.key) for column in inspect(model_class).columns}
+
+
+@lru_cache(maxsize=None)
+def _join_method(repository_class, name: str) -> Callable:
+    """Resolves `_join_<name>` on a repository class, caching per (class, name).
+
+    Join names come from a small fixed vocabulary per repository, so the string
+    concatenation and attribute lookup are paid once per pair instead of per query.
+    """
+    return getattr(repository_class, "_join_" + name)
+
+
+def safeguard_db_ops(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """A decorator to safeguard database operations and handle exceptions.
+
+    Applied bare (no call parentheses): the factory level added nothing but an
+    extra closure and stack frame on every DB call.
+    """
+
+    @wraps(fn)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        try:
+            return await fn(*args, **kwargs)
+        except SQLAlchemyError as e:
+            msg = f"An error occurred while executing the database operation: {e}"
+            syslog.error(msg)
+            raise SystemException(msg) from e
+
+    return wrapper
 
 
 class BaseRepository(Generic[ModelType]):
+    # Repositories are rebuilt per request; slots drop the per-instance
+    # __dict__ and make the hot self.session / self.model_class lookups an
+    # index into a fixed layout. Subclasses must declare __slots__ = () (or
+    # their own fields) to keep the benefit.
+    __slots__ = ("session", "model_class", "_mapper", "_columns", "_has_updated_at")
+
     def __init__(self, model: Type[ModelType], db_session: AsyncSession):
         self.session = db_session
         self.model_class = model
+        # Mapper introspection is stable per model; resolve it once instead of
+        # on every upsert call.
+        self._mapper = inspect(model)
+        self._columns = frozenset(self._mapper.columns.keys())
+        self._has_updated_at = "updated_at" in self._columns
 
-    @safeguard_db_ops()
+    @safeguard_db_ops
     async def _query(
         self,
         *,
@@ -53,6 +112,7 @@ class BaseRepository(Generic[ModelType]):
         fields: Optional[list] = None,
         distinct_: Optional[list] = None,
         join_: Optional[set[str]] = None,
+        load_: Optional[dict[str, str]] = None,
         order_: Optional[dict] = None,
         where_: Optional[list] = None,
         group_by_: Optional[list] = None,
@@ -79,6 +139,11 @@ class BaseRepository(Generic[ModelType]):
                 A dictionary specifying the joins to make. Each key should correspond to a valid
                 relationship defined in the model, and the value can provide additional
                 parameters for the join operation. Defaults to `None`.
+            load_ (Optional[Dict[str, str]], optional):
+                A mapping of relationship names to an eager-loading strategy, either
+                `'selectin'` or `'joined'`. Use `'joined'` for many-to-one relationships and
+                `'selectin'` for collections to avoid Cartesian-product over-fetch.
+                Defaults to `None`.
             order_ (Optional[Dict[str, Any]], optional):
                 A dictionary specifying the order of the results. It should contain either
                 an `'asc'` key with a list of fields to sort in ascending order or a `'desc'`
@@ -118,13 +183,28 @@ class BaseRepository(Generic[ModelType]):
             users = results.scalars().all()
             ```
         """
+        if (
+            skip is None
+            and limit is None
+            and not fields
+            and not distinct_
+            and not join_
+            and not load_
+            and not order_
+            and not where_
+            and not group_by_
+        ):
+            return _default_select(self.model_class)
+
         if fields:
-            query = select(*fields)
+            columns = [getattr(self.model_class, f) if isinstance(f, str) else f for f in fields]
+            query = select(*columns)
         else:
-            query = select(self.model_class)
+            query = _base_select(self.model_class)
         if where_:
-            for condition in where_:
-                query = query.where(condition)
+            # A single where(*conditions) appends all terms with one statement
+            # clone instead of cloning the Select once per condition.
+            query = query.where(*where_)
         if distinct_:
             query = query.distinct(*distinct_)
 
@@ -133,9 +213,15 @@ class BaseRepository(Generic[ModelType]):
         if limit is not None:
             query = query.limit(limit)
         query = self._maybe_join(query, join_)
+        query = self._maybe_loaded(query, load_)
         query = self._maybe_ordered(query, order_)
         if group_by_:
             query = query.group_by(*group_by_)
+        if settings.STRICT_LOADING and not fields:
+            # Relationships not opted in through load_ raise on access instead of
+            # silently emitting N+1 lazy loads; explicit loader options for a
+            # relationship take precedence over the wildcard.
+            query = query.options(raiseload("*", sql_only=True))
 
         return query
 
@@ -143,23 +229,35 @@ class BaseRepository(Generic[ModelType]):
         """
         Applies the specified joins to the given SQL query.
 
-        This method iterates over the provided `join_` dictionary and applies each join
-        to the SQLAlchemy `Select` query object using the `_add_join_to_query` helper method.
+        Each key in `join_` resolves to a `_join_<key>` method on the concrete
+        repository. A plain loop with a class-level getattr avoids the extra
+        callback frame reduce() added per join plus the thin wrapper method.
         """
         if not join_:
             return query
 
-        return reduce(self._add_join_to_query, join_.items(), query)
+        cls = type(self)
+        for key, value in join_.items():
+            query = _join_method(cls, key)(self, query, value)
+        return query
 
-    def _add_join_to_query(self, query: Select, join_: tuple) -> Select:
+    def _maybe_loaded(self, query: Select, load_: Optional[dict[str, str]] = None) -> Select:
         """
-        Applies a single join to the SQL query based on the provided join item.
+        Attaches eager-loading options to the query.
 
-        This helper method takes a tuple containing the join key and its associated parameters,
-        constructs the appropriate join method name, and applies the join to the query.
+        Each entry in `load_` maps a relationship name to a loading strategy:
+        `'joined'` emits a `joinedload` (one query with a JOIN, best for many-to-one)
+        while anything else defaults to `selectinload` (a second `SELECT ... IN`,
+        best for collections).
         """
-        key, value = join_
-        return getattr(self, "_join_" + key)(query, value)
+        if not load_:
+            return query
+
+        options_ = []
+        for key, strategy in load_.items():
+            attr = getattr(self.model_class, key)
+            options_.append(joinedload(attr) if strategy == "joined" else selectinload(attr))
+        return query.options(*options_)
 
     def _maybe_ordered(self, query: Select, order_: dict | None = None) -> Select:
         """
@@ -191,35 +289,37 @@ class BaseRepository(Generic[ModelType]):
             ordered_query = self._maybe_ordered(query, order_parameters)
             ```
         """
-        if order_:
-            if order_.get("asc", None) is not None:
-                for order in order_["asc"]:
-                    if isinstance(order, str):
-                        query = query.order_by(getattr(self.model_class, order).asc())
-                    elif isinstance(order, dict):
-                        model_class = order.get("model_class", self.model_class)
-                        field = order.get("field", None)
-                        if field is None:
-                            raise SystemException("Missing field in order")
-                        query = query.order_by(getattr(model_class, field).asc())
-                    else:
-                        raise SystemException("Order params must be string or dict")
-            else:
-                for order in order_["desc"]:
-                    if isinstance(order, str):
-                        query = query.order_by(getattr(self.model_class, order).desc())
-                    elif isinstance(order, dict):
-                        model_class = order.get("model_class", self.model_class)
-                        field = order.get("field", None)
-                        if field is None:
-                            raise SystemException("Missing field in order")
-                        query = query.order_by(getattr(model_class, field).desc())
-                    else:
-                        raise SystemException("Order params must be string or dict")
-
-        return query
+        if not order_:
+            return query
 
-    @safeguard_db_ops()
+        orders = order_.get("asc", None)
+        ascending = orders is not None
+        if not ascending:
+            orders = order_["desc"]
+
+        criteria = []
+        for order in orders:
+            if isinstance(order, str):
+                model_class, field = self.model_class, order
+            elif isinstance(order, dict):
+                model_class = order.get("model_class", self.model_class)
+                field = order.get("field", None)
+                if field is None:
+                    raise SystemException("Missing field in order")
+            else:
+                raise SystemException("Order params must be string or dict")
+            # Plain columns come from the cached map; anything else (hybrids,
+            # association proxies) falls back to the descriptor walk.
+            column = _column_map(model_class).get(field)
+            if column is None:
+                column = getattr(model_class, field)
+            criteria.append(column.asc() if ascending else column.desc())
+
+        # One order_by(*criteria) clones the statement once instead of once
+        # per ordering term.
+        return query.order_by(*criteria)
+
+    @safeguard_db_ops
     async def count(
         self,
         *,
@@ -266,10 +366,20 @@ class BaseRepository(Generic[ModelType]):
             print(f"Active users count: {count}")
             ```
         """
+        if not fields and not distinct_:
+            # Plain counts go straight to COUNT(*) over the table; wrapping the
+            # full entity SELECT in a subquery forces Postgres to plan (and
+            # sometimes materialize) the inner query just to measure it.
+            count_query = select(func.count()).select_from(self.model_class)
+            if where_:
+                count_query = count_query.where(*where_)
+            result = await self.session.execute(count_query)
+            return result.scalar_one()
+
         query = await self._query(where_=where_, fields=fields, distinct_=distinct_)
         return await self._count(query)
 
-    @safeguard_db_ops()
+    @safeguard_db_ops
     async def _count(self, query: Select) -> int:
         """
         Executes a count query to determine the number of records matching the provided query.
@@ -282,7 +392,7 @@ class BaseRepository(Generic[ModelType]):
         result = await self.session.execute(count_query)
         return result.scalar_one()
 
-    @safeguard_db_ops()
+    @safeguard_db_ops
     async def create(self, attributes: Optional[dict[str, Any]] = None, *, commit=False) -> ModelType:
         """
         Creates and adds a new model instance to the database.
@@ -304,30 +414,41 @@ class BaseRepository(Generic[ModelType]):
             await self.session.commit()
         return model
 
-    @safeguard_db_ops()
-    async def create_many(self, attributes_list: list[dict[str, Any]], commit=False) -> Sequence[ModelType]:
-        """Creates multiple model instances and adds them to the database.
+    @safeguard_db_ops
+    async def create_many(
+        self, attributes_list: Iterable[dict[str, Any]], commit=False, *, batch_size: int = 1000
+    ) -> Sequence[ModelType]:
+        """Creates multiple model instances through the driver's insert-many fast path.
+
+        The rows are passed to `execute()` as an executemany parameter list, which
+        lets SQLAlchemy's insertmanyvalues machinery page them into batched
+        statements on the asyncpg pipeline instead of rendering one giant VALUES
+        clause per batch. Large inputs are still consumed lazily in `batch_size`
+        chunks to keep memory flat.
 
         Args:
-            attributes_list (list[dict[str, Any]]): A list of dictionaries, where each dictionary
-                contains the attributes for one model instance.
+            attributes_list (Iterable[dict[str, Any]]): An iterable of dictionaries, where each
+                dictionary contains the attributes for one model instance.
             commit (bool): Whether to commit the transaction after creation. Defaults to False.
+            batch_size (int): Maximum number of rows sent per `INSERT` statement. Defaults to 1000.
 
         Returns:
             Sequence[ModelType]: A list of the created model instances.
         """
-        stmt = insert(self.model_class).values(attributes_list).returning(self.model_class)
-        result = await self.session.execute(stmt)
-        created_instances = result.scalars().all()
-
-        for isntance in created_instances:
-            self.session.add(isntance)
+        created_instances: list[ModelType] = []
+        # One statement object for every batch keeps the compiled-SQL cache key
+        # stable across calls.
+        stmt = insert(self.model_class).returning(self.model_class)
+        rows = iter(attributes_list)
+        while batch := list(islice(rows, batch_size)):
+            result = await self.session.execute(stmt, batch)
+            created_instances.extend(result.scalars().all())
 
         if commit:
             await self.session.commit()
         return created_instances
 
-    @safeguard_db_ops()
+    @safeguard_db_ops
     async def update(self, where_: list[Any], attributes: Dict[str, Any], commit=False) -> ModelType:
         """Partially updates an existing model instance in the database.
 
@@ -339,18 +460,19 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             ModelType: The updated model instance.
         """
-        query = update(self.model_class)
-        for condition in where_:
-            query = query.where(condition)
-        query = query.values(**attributes).returning(self.model_class)
+        query = update(self.model_class).where(*where_).values(**attributes).returning(self.model_class)
 
-        result = await self.session.execute(query)
+        # populate_existing refreshes any identity-mapped instance with the
+        # RETURNING values, so a prior get in the same session does not hold a
+        # stale copy; scalar() grabs the single expected row without first()'s
+        # extra iterator setup.
+        result = await self.session.execute(query, execution_options={"populate_existing": True})
         if commit:
             await self.session.commit()
 
-        return result.scalars().first()
+        return result.scalar()
 
-    @safeguard_db_ops()
+    @safeguard_db_ops
     async def upsert(
         self,
         index_elements: list[Any],
@@ -375,10 +497,8 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Optional[ModelType]: The created or updated model instance, or None if no instance is found.
         """
-        mapper = inspect(self.model_class)
-        columns = mapper.columns.keys()
-        valid_attributes = {key: value for key, value in attributes.items() if key in columns}
-        if "updated_at" in columns:
+        valid_attributes = {key: value for key, value in attributes.items() if key in self._columns}
+        if self._has_updated_at:
             valid_attributes["updated_at"] = func.now()
 
         query = (
@@ -392,22 +512,26 @@ class BaseRepository(Generic[ModelType]):
         if commit:
             await self.session.commit()
 
-        instance = result.scalars().first()
+        instance = result.scalar()
 
         if instance and eager_relations:
             instance = await self.session.get(
-                self.model_class, instance.id, options=[selectinload(relation) for relation in eager_relations]
+                self.model_class,
+                instance.id,
+                options=[selectinload(getattr(self.model_class, relation)) for relation in eager_relations],
             )
         return instance
 
-    @safeguard_db_ops()
+    @safeguard_db_ops
     async def upsert_many(
-        self, index_elements: list[Any], attributes_list: list[dict[str, Any]], commit=False
+        self, index_elements: list[Any], attributes_list: list[dict[str, Any]], commit=False, *, batch_size: int = 1000
     ) -> Sequence[ModelType]:
         """Upserts multiple model instances in the database.
 
-        For each entry in the `attributes_list`, the function will either insert a new record or update
-        an existing record based on conflicts with the `index_elements`.
+        All rows of a batch travel in a single multi-row `INSERT ... ON CONFLICT DO
+        UPDATE` statement rather than one statement per row; large inputs are chunked
+        in `batch_size` slices. The conflict keys themselves are left out of the
+        `SET` clause since re-assigning them is pointless work server-side.
 
         Args:
             index_elements (list[Any]): A list of index elements (columns) used to identify conflicts for
@@ -415,35 +539,41 @@ class BaseRepository(Generic[ModelType]):
             attributes_list (list[dict[str, Any]]): A list of dictionaries, where each dictionary contains
                 the attributes for a model instance to be upserted.
             commit (bool): Whether to commit the changes to the database. Defaults to False.
+            batch_size (int): Maximum number of rows sent per statement. Defaults to 1000.
 
         Returns:
             Sequence[ModelType]: A list of upserted model instances.
         """
-        mapper = inspect(self.model_class)
-        columns = mapper.columns.keys()
-        valid_attributes_list = [
-            {key: value for key, value in attributes.items() if key in columns} for attributes in attributes_list
-        ]
-
-        if "updated_at" in columns:
-            valid_attributes_list = [{**attributes, "updated_at": func.now()} for attributes in valid_attributes_list]
-
-        stmt = (
-            insert(self.model_class)
-            .values(valid_attributes_list)
-            .on_conflict_do_update(
-                index_elements=index_elements,
-                set_={col: getattr(insert(self.model_class).excluded, col) for col in valid_attributes_list[0]},
+        columns = self._columns
+        # One Insert construct serves the whole call: .excluded is read off it
+        # and every batch derives its statement generatively from the same base.
+        base_insert = insert(self.model_class)
+        excluded = base_insert.excluded
+        now_expr = func.now()
+        upserted: list[ModelType] = []
+        # Rows are filtered lazily in a single pass; the old second pass that
+        # rebuilt every dict just to stamp updated_at allocated N extra dicts
+        # and N now() expressions per call.
+        rows = ({key: value for key, value in attributes.items() if key in columns} for attributes in attributes_list)
+        while batch := list(islice(rows, batch_size)):
+            set_ = {col: getattr(excluded, col) for col in batch[0] if col not in index_elements}
+            if self._has_updated_at:
+                # Inserted rows pick up the column default; conflicting rows get
+                # stamped here, server-side, instead of per-row in Python.
+                set_["updated_at"] = now_expr
+            stmt = (
+                base_insert.values(batch)
+                .on_conflict_do_update(index_elements=index_elements, set_=set_)
+                .returning(self.model_class)
             )
-            .returning(self.model_class)
-        )
-        result = await self.session.execute(stmt)
+            result = await self.session.execute(stmt)
+            upserted.extend(result.scalars().all())
 
         if commit:
             await self.session.commit()
-        return result.scalars().all()
+        return upserted
 
-    @safeguard_db_ops()
+    @safeguard_db_ops
     async def get_many(
         self,
         skip: Optional[int] = None,
@@ -451,6 +581,7 @@ class BaseRepository(Generic[ModelType]):
         fields: Optional[list] = None,
         distinct_: Optional[list] = None,
         join_: Optional[set[str]] = None,
+        load_: Optional[dict[str, str]] = None,
         order_: Optional[dict] = None,
         where_: Optional[list] = None,
         group_by_: Optional[list] = None,
@@ -465,12 +596,15 @@ class BaseRepository(Generic[ModelType]):
             fields (Optional[list]): A list of specific fields to retrieve from the records.
             distinct_ (Optional[list]): A list of fields to apply distinct filtering on.
             join_ (Optional[set[str]]): A set of related tables to join with the query.
+            load_ (Optional[dict[str, str]]): A mapping of relationship names to an eager-loading
+                strategy (`'selectin'` or `'joined'`).
             order_ (Optional[dict]): A dictionary specifying the fields and their order (ASC/DESC).
             where_ (Optional[list]): A list of conditions to filter the records.
             group_by_ (Optional[list]): A list of fields to group the results by.
 
         Returns:
-            Sequence[ModelType]: A list of model instances that match the query parameters.
+            Sequence[ModelType]: A list of model instances that match the query parameters,
+            or a list of `RowMapping` dicts when `fields` is given.
         """
 
         query = await self._query(
@@ -479,44 +613,137 @@ class BaseRepository(Generic[ModelType]):
             fields=fields,
             distinct_=distinct_,
             join_=join_,
+            load_=load_,
             order_=order_,
             where_=where_,
             group_by_=group_by_,
         )
+        if fields:
+            # Column selection skips entity hydration (identity map, instrumentation)
+            # entirely. No yield_per here: it forces a server-side cursor, which
+            # AsyncSession.execute() rejects on asyncpg (stream() only), and the
+            # result is buffered into a list anyway.
+            result = await self.session.execute(query)
+            return result.mappings().all()
         result = await self.session.scalars(query)
         return result.all()
 
-    @safeguard_db_ops()
+    @safeguard_db_ops
+    async def get_many_and_count(
+        self,
+        skip: Optional[int] = None,
+        limit: Optional[int] = None,
+        distinct_: Optional[list] = None,
+        join_: Optional[set[str]] = None,
+        load_: Optional[dict[str, str]] = None,
+        order_: Optional[dict] = None,
+        where_: Optional[list] = None,
+    ) -> tuple[Sequence[ModelType], int]:
+        """Retrieves a page of records together with the total match count.
+
+        The total is computed with `COUNT(*) OVER ()` in the same statement as
+        the page itself, so a paginated listing costs one round trip instead of
+        a data query plus a separate count query.
+
+        Args:
+            skip (Optional[int]): The number of records to skip. Used for pagination.
+            limit (Optional[int]): The maximum number of records to return. Used for pagination.
+            distinct_ (Optional[list]): A list of fields to apply distinct filtering on.
+            join_ (Optional[set[str]]): A set of related tables to join with the query.
+            load_ (Optional[dict[str, str]]): A mapping of relationship names to an eager-loading
+                strategy (`'selectin'` or `'joined'`).
+            order_ (Optional[dict]): A dictionary specifying the fields and their order (ASC/DESC).
+            where_ (Optional[list]): A list of conditions to filter the records.
+
+        Returns:
+            tuple[Sequence[ModelType], int]: The page of model instances and the
+            total number of records matching the filter.
+        """
+        query = await self._query(
+            skip=skip,
+            limit=limit,
+            distinct_=distinct_,
+            join_=join_,
+            load_=load_,
+            order_=order_,
+            where_=where_,
+        )
+        if distinct_:
+            # Window functions are evaluated before DISTINCT, so COUNT(*)
+            # OVER () would report the pre-distinct total; take the separate
+            # subquery count instead.
+            result = await self.session.scalars(query)
+            items = result.unique().all() if load_ else result.all()
+            return items, await self.count(where_=where_, distinct_=distinct_)
+        query = query.add_columns(func.count().over().label("_total"))
+        result = await self.session.execute(query)
+        rows = result.unique().all() if load_ else result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+        if skip:
+            # The requested page is past the end; the window column vanished
+            # with the rows, so fall back to a plain count.
+            return [], await self.count(where_=where_, distinct_=distinct_)
+        return [], 0
+
+    @safeguard_db_ops
+    async def get_by_pk(self, pk: Any, load_: Optional[dict[str, str]] = None) -> ModelType | None:
+        """Retrieves a model instance by primary key.
+
+        `session.get` consults the identity map first, so repeat access within the
+        same session (e.g. a get followed by an update in one Transactional scope)
+        avoids the SELECT round trip entirely.
+
+        Args:
+            pk (Any): The primary key value.
+            load_ (Optional[dict[str, str]]): A mapping of relationship names to an
+                eager-loading strategy (`'selectin'` or `'joined'`).
+
+        Returns:
+            ModelType | None: The model instance, or None if no row matches.
+        """
+        options_ = []
+        if load_:
+            options_ = [
+                (joinedload if v == "joined" else selectinload)(getattr(self.model_class, k)) for k, v in load_.items()
+            ]
+        if settings.STRICT_LOADING:
+            options_.append(raiseload("*", sql_only=True))
+        return await self.session.get(self.model_class, pk, options=options_ or None)
+
+    @safeguard_db_ops
     async def first(
         self,
         fields: Optional[list] = None,
         where_: Optional[list] = None,
         skip: Optional[int] = None,
         join_: Optional[set[str]] = None,
+        load_: Optional[dict[str, str]] = None,
         order_: Optional[dict] = None,
-        relations: Optional[list[str]] = None,
     ) -> ModelType | None:
         """Retrieves the first model instance that matches the specified query parameters.
 
+        `join_` and `load_` are different axes: `join_` adds filter joins to the
+        statement, while `load_` controls relationship eager loading
+        (`'selectin'` or `'joined'`) exactly as in `get_many`.
+
         Args:
             fields (Optional[list]): A list of specific fields to retrieve from the model.
             where_ (Optional[list]): A list of conditions to filter the records.
             skip (Optional[int]): The number of records to skip, useful for pagination.
             join_ (Optional[set[str]]): A set of related tables to join with the query.
+            load_ (Optional[dict[str, str]]): A mapping of relationship names to an
+                eager-loading strategy (`'selectin'` or `'joined'`).
             order_ (Optional[dict]): A dictionary specifying the fields and their order (ASC/DESC).
-            relations (Optional[list[str]]): A list of relationships to eagerly load with the query.
 
         Returns:
             ModelType | None: The first model instance that matches the query parameters, or None if no match is found.
         """
-        query = await self._query(skip=skip, join_=join_, fields=fields, order_=order_, where_=where_)
-        if relations:
-            for relation in relations:
-                query = query.options(selectinload(relation))
+        query = await self._query(skip=skip, join_=join_, fields=fields, load_=load_, order_=order_, where_=where_)
         query = await self.session.scalars(query)
         return query.first()
 
-    @safeguard_db_ops()
+    @safeguard_db_ops
     async def exists(
         self,
         where_: Optional[list] = None,
@@ -529,34 +756,46 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             bool: True if a model instance exists that matches the given conditions, False otherwise.
         """
-        query = select(self.model_class)
+        # SELECT 1 ... LIMIT 1 answers the question without hydrating an entity
+        # or shipping every column of the first matching row over the wire.
+        query = select(literal(1)).select_from(self.model_class).limit(1)
         if where_:
-            query = await self._query(where_=where_)
-        result = await self.session.scalars(query)
-        return bool(result.first())
+            query = query.where(*where_)
+        return (await self.session.scalar(query)) is not None
 
-    @safeguard_db_ops()
+    @safeguard_db_ops
     async def delete(
         self,
         where_: Optional[list] = None,
         *,
+        returning_: bool = False,
         synchronize_session: SynchronizeSessionEnum = SynchronizeSessionEnum.FALSE,
     ):
         """Deletes model instances that match the given conditions.
 
+        By default only the affected row count is returned, so the database
+        never serializes the deleted rows back over the wire. Pass
+        `returning_=True` to get the deleted instances via `DELETE ... RETURNING`
+        in the same statement.
+
         Args:
             where_ (Optional[list]): A list of conditions used to filter which model instances to delete.
+            returning_ (bool): Whether to return the deleted model instances instead of the row count.
+                Defaults to False.
             synchronize_session (SynchronizeSessionEnum): Defines how the session synchronization should be handled.
                 Defaults to `SynchronizeSessionEnum.FALSE`.
 
         Returns:
-            Sequence[ModelType]: A list of the deleted model instances.
+            Sequence[ModelType] | int: The deleted model instances when `returning_` is set,
+            otherwise the number of deleted rows.
         """
-        del_instances = await self.get_many(where_=where_)
         query = delete(self.model_class)
-        if where_ is not None:
-            for condition in where_:
-                query = query.where(condition)
+        if where_:
+            query = query.where(*where_)
         query = query.execution_options(synchronize_session=synchronize_session.value)
-        await self.session.execute(query)
-        return del_instances
+        if returning_:
+            query = query.returning(self.model_class)
+            result = await self.session.execute(query)
+            return result.scalars().all()
+        result = await self.session.execute(query)
+        return result.rowcount
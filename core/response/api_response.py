@@ -12,6 +12,15 @@ class Ok(BaseModel, Generic[T]):
     def __init__(self, data: T):
         super().__init__(data=data)
 
+    @classmethod
+    def build(cls, data: T) -> "Ok[T]":
+        """Builds the envelope without validating `data`.
+
+        The payload has already been validated (or produced) by the endpoint,
+        so re-running Pydantic validation here is pure overhead.
+        """
+        return cls.model_construct(status="success", data=data)
+
     @staticmethod
     def format(data):
         return {"status": "success", "data": data}
@@ -28,3 +37,14 @@ class Error(BaseModel):
 
     def __init__(self, error_code: int, message: str):
         super().__init__(error=ErrorInfo(error_code=error_code, message=message))
+
+    @classmethod
+    def build(cls, error_code: int, message: str) -> "Error":
+        """Builds the envelope without validation; both fields are trusted."""
+        return cls.model_construct(
+            status="error", error=ErrorInfo.model_construct(error_code=error_code, message=message)
+        )
+
+    @staticmethod
+    def format(error_code: int, message: str) -> dict:
+        return {"status": "error", "error": {"error_code": error_code, "message": message}}
@@ -1,47 +1,70 @@
+from functools import lru_cache
 from typing import Any, Optional
 
+_MISSING = object()
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Splits a dotted path once per distinct string.
+
+    Paths in config code are overwhelmingly constant strings, so caching the
+    split removes a list allocation from every dig/plant call.
+    """
+    return tuple(path.split("."))
+
 
 def dict_deep_extend(*dicts):
     """
     Merge an arbitrary number of dictionaries deeply.
-    """
 
-    def merge_2_dicts(a, b):
-        if isinstance(a, dict) and isinstance(b, dict):
-            result = {**b}
-            for key, value in a.items():
-                if key not in result:
-                    result[key] = value
-                else:
-                    result[key] = merge_2_dicts(value, result[key])
-            return result
-        else:
-            return a if b is None else b
-
-    merged = {}
+    Later dictionaries win on conflicts, except that an explicit ``None`` never
+    overwrites an existing value. The merge walks an explicit work stack and
+    mutates a single accumulator in place, so one dict node is allocated per
+    nested level instead of one per level per merge step as the old recursive
+    rebuild did. Input dictionaries are never mutated.
+    """
+    merged: dict = {}
     for d in dicts:
         if not isinstance(d, dict):
             raise TypeError("All arguments must be dictionaries")
-        merged = merge_2_dicts(merged, d)
+        stack = [(merged, d)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                current = dst.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                elif isinstance(value, dict):
+                    # Copy into an owned node so later merges never write
+                    # through into a caller's nested dict.
+                    dst[key] = owned = {}
+                    stack.append((owned, value))
+                elif value is not None or key not in dst:
+                    dst[key] = value
     return merged
 
 
 def dig(dict_: dict[str, Any], path: str, default: Optional[Any] = None) -> Any:
-    keys = path.split(".")
     value = dict_
-    for key in keys:
-        try:
-            value = value[key]
-        except KeyError:
+    for key in _split_path(path):
+        if not isinstance(value, dict):
+            return default
+        # A sentinel-default .get avoids the exception-handler setup that the
+        # old try/except paid on every miss.
+        value = value.get(key, _MISSING)
+        if value is _MISSING:
             return default
     return value
 
 
 def plant(dict_: dict[str, Any], path: str, value: Any):
-    keys = path.split(".")
+    keys = _split_path(path)
     current = dict_
     for key in keys[:-1]:
-        if key not in current or not isinstance(current[key], dict):
-            current[key] = {}
-        current = current[key]
+        # One .get probe instead of a membership test plus a second lookup.
+        node = current.get(key)
+        if not isinstance(node, dict):
+            node = current[key] = {}
+        current = node
     current[keys[-1]] = value
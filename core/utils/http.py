@@ -1,13 +1,44 @@
-from typing import Optional
+from typing import Any, Optional
 
 import httpx
+import orjson
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Returns the shared AsyncClient, creating it on first use.
+
+    Reusing one client keeps connections pooled across calls (and across
+    tenacity retries), so repeat requests to the same host skip the TCP/TLS
+    handshake instead of paying it per call.
+    """
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+            timeout=httpx.Timeout(10.0, connect=3.0),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """
+    Closes the shared AsyncClient. Call on application shutdown.
+    """
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=2, max=10),  # Exponential backoff with a max wait of 10 seconds
-    retry=retry_if_exception_type(httpx.HTTPStatusError),  # Retry only on HTTP status errors
+    # Status errors plus the transient network failures worth retrying.
+    retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.ConnectError, httpx.ReadTimeout)),
 )
 async def fetch(
     url: str,
@@ -23,7 +54,7 @@ async def fetch(
         url (str): The URL to send the request to.
         method (str, optional): The HTTP method to use. Defaults to 'GET'.
         client (httpx.AsyncClient, optional): An instance of httpx.AsyncClient for connection pooling.
-            If None, a new client is created and closed within the function. Defaults to None.
+            If None, the shared module-level client is used. Defaults to None.
         **kwargs: Additional keyword arguments passed to `client.request`.
 
     Returns:
@@ -31,22 +62,46 @@ async def fetch(
     """
     from core.logger import syslog
 
-    close_client = False
     if client is None:
-        client = httpx.AsyncClient()
-        close_client = True
+        client = get_http_client()
 
     try:
         response = await client.request(method, url, **kwargs)
         response.raise_for_status()
         syslog.info(f"Successfully fetched {response.url}")
-        return response.json()
+        return response
     except httpx.HTTPStatusError as exc:
         print(f"HTTP error occurred: {exc} {exc.request.url}")
         raise
     except httpx.RequestError as exc:
         syslog.error(f"HTTP error: {exc} {exc.request.url}")
         raise
-    finally:
-        if close_client:
-            await client.aclose()
+
+
+async def fetch_json(
+    url: str,
+    *,
+    method: str = "GET",
+    client: Optional[httpx.AsyncClient] = None,
+    **kwargs,
+) -> Any:
+    """
+    Sends a request via `fetch` and returns the JSON-decoded body.
+
+    Decoding goes through orjson on the raw bytes, which is noticeably faster
+    than the stdlib parser behind `Response.json()` for typical API payloads.
+    Callers that want the raw response (bytes, headers, streaming) should use
+    `fetch` directly and skip the decode entirely.
+
+    Args:
+        url (str): The URL to send the request to.
+        method (str, optional): The HTTP method to use. Defaults to 'GET'.
+        client (httpx.AsyncClient, optional): An instance of httpx.AsyncClient for connection pooling.
+            If None, the shared module-level client is used. Defaults to None.
+        **kwargs: Additional keyword arguments passed to `client.request`.
+
+    Returns:
+        Any: The decoded JSON body.
+    """
+    response = await fetch(url, method=method, client=client, **kwargs)
+    return orjson.loads(response.content)
@@ -1,12 +1,35 @@
+import importlib.util
+from functools import lru_cache
+
+import tomllib
+
+
+@lru_cache(maxsize=256)
 def has(package: str) -> bool:
     """
     Check if a package is installed.
 
+    The check resolves the module spec instead of importing, so probing a heavy
+    package costs a sys.path scan rather than executing its top-level code.
+    Results are cached since installation status never changes mid-process.
+
     Args:
         package (str): Name of the package.
     """
     try:
-        __import__(package)
-        return True
-    except ImportError:
+        return importlib.util.find_spec(package) is not None
+    except (ValueError, ModuleNotFoundError):
         return False
+
+
+@lru_cache(maxsize=1)
+def load_pyproject() -> dict:
+    """
+    Parse the project's pyproject.toml once per process.
+
+    The file never changes at runtime, so callers (app factory, root endpoint)
+    share a single cached parse instead of re-reading it per call. tomllib is
+    stdlib and considerably faster than the pure-Python toml package.
+    """
+    with open("pyproject.toml", "rb") as f:
+        return tomllib.load(f)
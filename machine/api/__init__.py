@@ -1,6 +1,5 @@
 import re
 
-import toml
 from fastapi import APIRouter, Request
 from fastapi.templating import Jinja2Templates
 
@@ -15,20 +14,25 @@ router.include_router(router_v1)
 router.include_router(router_v2)
 templates = Jinja2Templates(directory="templates")
 
+_NAME_SEPARATORS = re.compile(r"[-_]")
 
-@router.get("/")
-def root(request: Request):
-    with open("pyproject.toml", "r") as f:
-        toml_content = f.read()
 
-    toml_data = toml.loads(toml_content)
+def _build_root_context() -> dict:
+    toml_data = ut.load_pyproject()
     project_name = ut.dig(toml_data, "tool.poetry.name", "fastAPI_project")
-    project_name = re.sub(r"[-_]", " ", project_name).title()
+    project_name = _NAME_SEPARATORS.sub(" ", project_name).title()
     authors = ut.dig(toml_data, "tool.poetry.authors", [])
+    return {"project_name": project_name, "authors": authors}
+
 
-    context = {"project_name": project_name, "authors": authors}
+# Everything on the landing page except the request itself is static, so the
+# context is assembled once at import time.
+_ROOT_CONTEXT = _build_root_context()
 
-    return templates.TemplateResponse("index.html", {"request": request, **context})
+
+@router.get("/")
+def root(request: Request):
+    return templates.TemplateResponse("index.html", {"request": request, **_ROOT_CONTEXT})
 
 
 __all__ = ["router"]
@@ -1,74 +1,90 @@
-from typing import List, Union
+from typing import List
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 
-from core.exceptions import BadRequestException
 from machine.controllers import UserController
 from machine.models import User
-from machine.providers import InternalProvider
+from machine.providers import user_controller_factory
 from machine.schemas.requests.user import UserRequest
 from machine.schemas.responses.user import UserResponse
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+# One shared Depends marker: FastAPI caches solved dependencies per callable,
+# so every route (and both API versions) reuses the same solver entry.
+UserControllerDep = Depends(user_controller_factory)
 
-@router.post("/", response_model=Union[UserResponse, List[UserResponse]])
+# Serializes a whole bulk payload in one pydantic-core call instead of N
+# per-model model_dump() round trips through Python.
+_USER_REQUEST_LIST = TypeAdapter(List[UserRequest])
+_USER_RESPONSE_LIST = TypeAdapter(List[UserResponse])
+
+
+@router.post("/", response_model=UserResponse)
 async def create(
-    body: Union[UserRequest, List[UserRequest]],
-    bulk: bool = Query(False, description="Whether to create a bulk of users"),
-    user_controller: UserController = Depends(InternalProvider().get_user_controller),
+    body: UserRequest,
+    user_controller: UserController = UserControllerDep,
+):
+    """
+    Create a user
+    """
+    return await user_controller.create(body.model_dump())
+
+
+@router.post("/bulk", response_model=List[UserResponse])
+async def create_bulk(
+    body: List[UserRequest],
+    user_controller: UserController = UserControllerDep,
 ):
     """
-    Create user(s)
+    Create users in bulk
     """
-    if bulk:
-        if not isinstance(body, List):
-            raise BadRequestException("Body must be a list when bulk is True")
-        created_users = await user_controller.create_many([user.model_dump() for user in body])
-        return created_users
-    else:
-        if isinstance(body, List):
-            raise BadRequestException("Body must be a single user when bulk is False")
-        created_user = await user_controller.create(body.model_dump())
-        return created_user
+    return await user_controller.create_many(_USER_REQUEST_LIST.dump_python(body))
 
 
 @router.post("/upsert")
 async def upsert(
-    body: Union[UserRequest, List[UserRequest]],
-    bulk: bool = Query(False, description="Whether to upsert a bulk of users"),
-    user_controller: UserController = Depends(InternalProvider().get_user_controller),
+    body: UserRequest,
+    user_controller: UserController = UserControllerDep,
 ):
     """
-    Upsert user(s)
+    Upsert a user
     """
-    if bulk:
-        if not isinstance(body, List):
-            raise BadRequestException("Body must be a list when bulk is True")
-        created_users = await user_controller.upsert_many(index_elements=["id"], attributes_list=[user.model_dump() for user in body])
-        return created_users
-    else:
-        if isinstance(body, List):
-            raise BadRequestException("Body must be a single user when bulk is False")
-        created_user = await user_controller.upsert(index_elements=["id"], attributes=body.model_dump())
-        return created_user
-
-
-@router.get("/")
+    return await user_controller.upsert(index_elements=["id"], attributes=body.model_dump())
+
+
+@router.post("/upsert/bulk")
+async def upsert_bulk(
+    body: List[UserRequest],
+    user_controller: UserController = UserControllerDep,
+):
+    """
+    Upsert users in bulk
+    """
+    return await user_controller.upsert_many(
+        index_elements=["id"], attributes_list=_USER_REQUEST_LIST.dump_python(body)
+    )
+
+
+@router.get("/", response_model=List[UserResponse])
 async def list(
-    user_controller: UserController = Depends(InternalProvider().get_user_controller),
+    user_controller: UserController = UserControllerDep,
 ):
     """
     List all users
     """
-    users = await user_controller.get_many(distinct=[User.name])
-    return users
+    users = await user_controller.get_many(distinct_=[User.name])
+    # Validate and dump the whole list in pydantic-core, then hand the plain
+    # payload straight to orjson — skips jsonable_encoder's per-field walk.
+    return ORJSONResponse(_USER_RESPONSE_LIST.dump_python(_USER_RESPONSE_LIST.validate_python(users), mode="json"))
 
 
 @router.delete("/{id}")
 async def delete(
     id: int,
-    user_controller: UserController = Depends(InternalProvider().get_user_controller),
+    user_controller: UserController = UserControllerDep,
 ):
     """
     Delete a user
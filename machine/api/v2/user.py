@@ -1,35 +1,45 @@
 from typing import List
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 
 from machine.controllers import UserController
 from machine.models import User
-from machine.providers import InternalProvider
+from machine.providers import user_controller_factory
 from machine.schemas.requests.user import UserRequest
 from machine.schemas.responses.user import UserResponse
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+# One shared Depends marker: FastAPI caches solved dependencies per callable,
+# so every route (and both API versions) reuses the same solver entry.
+UserControllerDep = Depends(user_controller_factory)
+
+_USER_RESPONSE_LIST = TypeAdapter(List[UserResponse])
+
 
 @router.post("/", response_model=UserResponse)
 async def create(
     body: UserRequest,
-    user_controller: UserController = Depends(InternalProvider().get_user_controller),
+    user_controller: UserController = UserControllerDep,
 ):
     return await user_controller.create(body.model_dump())
 
 
 @router.get("/", response_model=List[UserResponse])
 async def list(
-    user_controller: UserController = Depends(InternalProvider().get_user_controller),
+    user_controller: UserController = UserControllerDep,
 ):
     users = await user_controller.get_many()
-    return users
+    # Validate and dump the whole list in pydantic-core, then hand the plain
+    # payload straight to orjson — skips jsonable_encoder's per-field walk.
+    return ORJSONResponse(_USER_RESPONSE_LIST.dump_python(_USER_RESPONSE_LIST.validate_python(users), mode="json"))
 
 
 @router.delete("/{id}")
 async def delete(
     id: int,
-    user_controller: UserController = Depends(InternalProvider().get_user_controller),
+    user_controller: UserController = UserControllerDep,
 ):
     return await user_controller.delete(where_=[User.id == id])
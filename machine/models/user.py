@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import BigInteger, Column, Identity, String
 
 from core.db import Base
 from core.db.mixins import TimestampMixin
@@ -7,5 +7,7 @@ from core.db.mixins import TimestampMixin
 class User(Base, TimestampMixin):
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    # IDENTITY avoids the legacy SERIAL sequence-ownership quirks; cache=32
+    # batches sequence allocation server-side during concurrent bulk inserts.
+    id = Column(BigInteger, Identity(always=False, cache=32), primary_key=True)
     name = Column(String, nullable=False)
@@ -1,5 +1,6 @@
-from .internal import InternalProvider
+from .internal import InternalProvider, user_controller_factory
 
 __all__ = [
     "InternalProvider",
+    "user_controller_factory",
 ]
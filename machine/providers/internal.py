@@ -1,9 +1,6 @@
-from functools import partial
-
 from fastapi import Depends
 
 import machine.controllers as ctrl
-import machine.models as modl
 import machine.repositories as repo
 from core.db.session import DB_MANAGER, Dialect
 from core.utils import singleton
@@ -19,7 +16,23 @@ class InternalProvider:
     db_session_keeper = DB_MANAGER[Dialect.POSTGRES]
 
     # Repositories
-    user_repository = partial(repo.UserRepository, model=modl.User)
+    user_repository = repo.UserRepository
+
+    def __init__(self):
+        self._user_controller: ctrl.UserController | None = None
 
     def get_user_controller(self, db_session=Depends(db_session_keeper.get_session)):
-        return ctrl.UserController(user_repository=self.user_repository(db_session=db_session))
+        # Controllers and repositories are stateless apart from the session, so
+        # build them once and just rebind the session on subsequent requests.
+        controller = self._user_controller
+        if controller is None:
+            controller = ctrl.UserController(user_repository=self.user_repository(db_session=db_session))
+            self._user_controller = controller
+        else:
+            controller.repository.session = db_session
+        return controller
+
+
+# Resolved once at import time; endpoints depend on this bound method instead
+# of re-evaluating InternalProvider() in every Depends(...) default.
+user_controller_factory = InternalProvider().get_user_controller
@@ -1,5 +1,11 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from core.repository import BaseRepository
 from machine.models import User
 
 
-class UserRepository(BaseRepository[User]): ...
+class UserRepository(BaseRepository[User]):
+    __slots__ = ()
+
+    def __init__(self, db_session: AsyncSession):
+        super().__init__(model=User, db_session=db_session)
@@ -1,16 +1,15 @@
 import re
 from contextlib import asynccontextmanager
 
-import toml
 from fastapi import FastAPI, Request
 from fastapi.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 import core.utils as ut
 from core.cache import Cache, DefaultKeyMaker, RedisBackend
+from core.db.session import DB_MANAGER, Dialect
 from core.exceptions import CustomException
-from core.fastapi.middlewares import SQLAlchemyMiddleware
 from core.logger import syslog
 from core.response import Error
 from core.settings import settings
@@ -21,19 +20,23 @@ def init_routers(app_: FastAPI) -> None:
     app_.include_router(router)
 
 
+# The catch-all payload never varies; build it once instead of per failure.
+_INTERNAL_ERROR = Error.format(500, "Internal Server Error")
+
+
 def init_listeners(app_: FastAPI) -> None:
     @app_.exception_handler(CustomException)
     async def custom_exception_handler(request: Request, exc: CustomException):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.code,
-            content=Error(error_code=exc.error_code, message=exc.message).model_dump(),
+            content=Error.format(exc.error_code, exc.message),
         )
 
     @app_.exception_handler(Exception)
     async def exception_handler(request: Request, exc: Exception):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
-            content=Error(error_code=500, message="Internal Server Error").model_dump(),
+            content=_INTERNAL_ERROR,
         )
 
 
@@ -64,7 +67,6 @@ def make_middleware() -> list[Middleware]:
             allow_methods=["*"],
             allow_headers=["*"],
         ),
-        Middleware(SQLAlchemyMiddleware),
     ]
     return middleware
 
@@ -87,15 +89,19 @@ def on_shutdown(app: FastAPI):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     on_startup(app)
+    if not settings.PYTEST:
+        try:
+            await DB_MANAGER[Dialect.POSTGRES].prewarm()
+        except Exception as e:
+            # A cold pool is a latency problem, not a startup blocker.
+            syslog.warning(f"Skipped DB pool prewarm: {e}")
     yield
+    await ut.close_http_client()
     on_shutdown(app)
 
 
 def create_machine() -> FastAPI:
-    with open("pyproject.toml", "r") as f:
-        toml_content = f.read()
-
-    toml_data = toml.loads(toml_content)
+    toml_data = ut.load_pyproject()
     project_name = ut.dig(toml_data, "tool.poetry.name", "fastAPI_project")
     project_name = re.sub(r"[-_]", " ", project_name).title()
     project_description = ut.dig(toml_data, "tool.poetry.description", "fastAPI_project")
@@ -105,6 +111,8 @@ def create_machine() -> FastAPI:
         description=project_description,
         version="0.0.1",
         root_path="/api",
+        # orjson serializes response bodies in C instead of json.dumps.
+        default_response_class=ORJSONResponse,
         docs_url="/docs",
         redoc_url="/redoc",
         middleware=make_middleware(),
@@ -0,0 +1,49 @@
+"""user id bigint identity
+
+Revision ID: 8f2c1d7a40e9
+Revises: 21f3364b195b
+Create Date: 2026-08-31 10:12:44.103276
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8f2c1d7a40e9"
+down_revision: Union[str, None] = "21f3364b195b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "users",
+        "id",
+        existing_type=sa.Integer(),
+        type_=sa.BigInteger(),
+        existing_nullable=False,
+    )
+    # Replace the legacy SERIAL default with an IDENTITY column.
+    op.execute("ALTER TABLE users ALTER COLUMN id DROP DEFAULT")
+    op.execute("DROP SEQUENCE IF EXISTS users_id_seq")
+    op.execute("ALTER TABLE users ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY (CACHE 32)")
+    op.execute(
+        "SELECT setval(pg_get_serial_sequence('users', 'id'), COALESCE((SELECT MAX(id) FROM users), 0) + 1, false)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE users ALTER COLUMN id DROP IDENTITY IF EXISTS")
+    op.alter_column(
+        "users",
+        "id",
+        existing_type=sa.BigInteger(),
+        type_=sa.Integer(),
+        existing_nullable=False,
+    )
+    op.execute("CREATE SEQUENCE users_id_seq OWNED BY users.id")
+    op.execute("SELECT setval('users_id_seq', COALESCE((SELECT MAX(id) FROM users), 0) + 1, false)")
+    op.execute("ALTER TABLE users ALTER COLUMN id SET DEFAULT nextval('users_id_seq')")
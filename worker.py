@@ -1,30 +1,114 @@
+from functools import lru_cache
 from urllib.parse import urlparse
+from uuid import uuid4
 
-import dramatiq
-from dramatiq.brokers.redis import RedisBroker
-from dramatiq.middleware import AgeLimit, AsyncIO, Retries, TimeLimit
-
+import core.utils as ut
 from core.settings import settings
 
-redis_parameters = urlparse(settings.REDIS_URL)
-
-
-middleware = [
-    AsyncIO(),
-    AgeLimit(max_age=3600000),  # 1 hour max age
-    TimeLimit(time_limit=3600000),  # 1 hour time limit
-    Retries(max_retries=3),
-]
-broker = RedisBroker(
-    host=redis_parameters.hostname,
-    port=redis_parameters.port,
-    db=9,
-    username=redis_parameters.username,
-    password=redis_parameters.password,
-    heartbeat_timeout=10000,
-    middleware=middleware,
-    namespace="dramatiq",
-)
-dramatiq.set_broker(broker)
+# Install uvloop's event-loop policy before dramatiq's AsyncIO middleware
+# creates its loop, so async actors run on libuv instead of the default
+# selector loop.
+if ut.has("uvloop"):
+    import uvloop
+
+    uvloop.install()
+
+# Worker prefetch is tuned via the dramatiq_queue_prefetch env var, which the
+# dramatiq CLI reads at import time — before this module runs — so it must be
+# set in the process environment (.env / supervisord), not from Settings here.
+import dramatiq  # noqa: E402
+import redis  # noqa: E402
+from dramatiq.brokers.redis import RedisBroker  # noqa: E402
+from dramatiq.common import current_millis  # noqa: E402
+from dramatiq.middleware import AgeLimit, AsyncIO, Retries, TimeLimit  # noqa: E402
+
+# ParseResult exposes hostname/port/username/password as properties that
+# re-split the netloc on every access; decompose once into plain constants.
+_redis_parameters = urlparse(settings.DRAMATIQ_REDIS_URL or settings.REDIS_URL)
+REDIS_HOST = _redis_parameters.hostname
+REDIS_PORT = _redis_parameters.port
+REDIS_USERNAME = _redis_parameters.username
+REDIS_PASSWORD = _redis_parameters.password
+
+
+@lru_cache(maxsize=1)
+def get_broker() -> RedisBroker:
+    # A shared bounded pool with keepalive: producer-side actor.send() calls
+    # reuse warm sockets instead of paying a TCP+AUTH handshake per publish.
+    pool = redis.ConnectionPool(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        db=9,
+        username=REDIS_USERNAME,
+        password=REDIS_PASSWORD,
+        max_connections=64,
+        socket_keepalive=True,
+    )
+    middleware = [
+        AsyncIO(),
+        AgeLimit(max_age=3600000),  # 1 hour max age
+        TimeLimit(time_limit=3600000),  # 1 hour time limit
+        Retries(max_retries=3),
+    ]
+    if settings.DRAMATIQ_RESULTS:
+        from dramatiq.results import Results
+        from dramatiq.results.backends.redis import RedisBackend
+
+        # Hash-based storage with a short TTL: callers poll a key instead of
+        # holding a connection on BLPOP, and Redis memory stays bounded.
+        results_backend = RedisBackend(client=redis.Redis(connection_pool=pool))
+        middleware.append(Results(backend=results_backend, result_ttl=settings.DRAMATIQ_RESULTS_TTL_MS))
+    return RedisBroker(
+        connection_pool=pool,
+        heartbeat_timeout=10000,
+        middleware=middleware,
+        namespace="dramatiq",
+    )
+
+
+dramatiq.set_broker(get_broker())
+
+
+def send_many(actor, payloads: list[dict]) -> list:
+    """Enqueue many messages for `actor` over a single pipelined round trip.
+
+    actor.send() pays one EVALSHA round trip per message; for fan-out bursts
+    this serializes on network RTT. This mirrors RedisBroker.enqueue but
+    queues every dispatch-script call on one pipeline and flushes once.
+
+    Args:
+        actor: The dramatiq actor to enqueue for.
+        payloads (list[dict]): Keyword arguments for each message.
+    """
+    broker = get_broker()
+    dispatch = broker.scripts["dispatch"]
+    keys = [broker.namespace]
+    messages = []
+    with broker.client.pipeline(transaction=False) as pipe:
+        for payload in payloads:
+            message = actor.message(**payload)
+            # Same reason as RedisBroker.enqueue: retries must get a fresh
+            # Redis-level id, so the Message id cannot be reused.
+            message = message.copy(options={"redis_message_id": str(uuid4())})
+            broker.emit_before("enqueue", message, None)
+            args = [
+                "enqueue",
+                current_millis(),
+                message.queue_name,
+                broker.broker_id,
+                broker.heartbeat_timeout,
+                broker.dead_message_ttl,
+                broker._should_do_maintenance("enqueue"),
+                broker._max_unpack_size(),
+                message.options["redis_message_id"],
+                message.encode(),
+            ]
+            dispatch(args=args, keys=keys, client=pipe)
+            messages.append(message)
+        pipe.execute()
+    for message in messages:
+        broker.emit_after("enqueue", message, None)
+    return messages
+
 
 from tasks import *  # noqa